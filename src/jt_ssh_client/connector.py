@@ -1,41 +1,160 @@
+import asyncio
+import concurrent.futures
+import os
+import posixpath
 import sys
-from os import system
+import threading
+import time
+from functools import cached_property, lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Optional, Union
 
-from paramiko import BadHostKeyException, RSAKey, SFTPClient, SSHClient, Transport
+from paramiko import BadHostKeyException, HostKeys, RSAKey, SFTPClient, SSHClient, Transport
 from paramiko.client import AutoAddPolicy, MissingHostKeyPolicy
 from paramiko.sftp_attr import SFTPAttributes
 from paramiko.ssh_exception import AuthenticationException
 from scp import SCPClient
 
 from .enums import Client
+from .pool import pool
+
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+# * SFTP tuning for the asyncssh transfer path
+_ASYNC_BLOCK_SIZE = 256 * 1024
+_ASYNC_MAX_REQUESTS = 128
+
+# * Channel flow-control defaults; paramiko's 2 MB window and 32 KB
+# * packets cap throughput on high bandwidth-delay-product links
+_DEFAULT_WINDOW_SIZE = 4 * 1024 * 1024
+_DEFAULT_MAX_PACKET_SIZE = 256 * 1024
+
+# * Maximum number of paths handed to a single SCP get/put call
+_SCP_BATCH_SIZE = 70
+
+# * Maximum concurrent channels opened on one transport; stays below
+# * the OpenSSH MaxSessions=10 default
+_MAX_CONCURRENT_CHANNELS = 9
 
 # region: Helper methods
 
 
-def _scp_client_progress_text_callback(
-    file: bytes,
+def _batch(
+    items,
     size: int,
-    sent: int,
-    peername: tuple,
 ):
     """
-    SCP text based progress handler
+    Yield successive fixed size batches from a collection
 
     Args:
-        file: File
-        size: Size of file in bytes
-        sent: Total bytes sent
-        peername: Remote host name and port number
+        items: Collection to be batched
+        size: Maximum number of items per batch
+    """
+    iterator = iter(items)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@lru_cache(maxsize=1)
+def _load_known_hosts(
+    path: str,
+    mtime_ns: int,
+) -> HostKeys:
     """
-    prefix = f"{peername[0]}:{peername[1]} | {file.decode('utf-8')}"
-    percentage = 100 * (sent / float(size))
+    Load the system known hosts file, cached across instances
 
-    if sent < size:
-        sys.stdout.write(f"{prefix} | {percentage:.2f}%\r")
-    else:
-        sys.stdout.write(f"{prefix} | {percentage:.2f}%\n")
+    Args:
+        path: Path to the known hosts file
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Remarks:
+        Parsing known_hosts hashes every entry, so the parsed keys are
+        memoized; the modification time in the cache key invalidates
+        stale entries when the file changes on disk.
+    """
+    return HostKeys(path)
+
+
+@lru_cache(maxsize=32)
+def _load_rsa_key(
+    path: str,
+    passphrase: Optional[str],
+    mtime_ns: int,
+) -> RSAKey:
+    """
+    Load an RSA private key from file, cached across instances
+
+    Args:
+        path: Path to SSH private key
+        passphrase: SSH key passphrase
+        mtime_ns: Modification time of the key file in nanoseconds
+
+    Remarks:
+        Key parsing and passphrase decryption are CPU heavy, so the
+        parsed key is memoized; the modification time in the cache key
+        invalidates stale entries when the file changes on disk.
+    """
+    return RSAKey.from_private_key_file(path, passphrase)
+
+
+def _make_scp_progress_callback(
+    interval: float = 0.1,
+) -> Callable:
+    """
+    Create a rate limited SCP text based progress handler
+
+    Args:
+        interval: Minimum seconds between progress writes
+
+    Remarks:
+        The handler fires once per buffer chunk, so an unthrottled
+        stdout write is a syscall per packet. Intermediate updates are
+        rate limited, and the decoded file prefix and percentage scale
+        - invariant across all packets of one transfer - are computed
+        once per file; the final update of a transfer is always
+        written.
+    """
+    last_emit = 0.0
+
+    # * Keyed by (file, size): the sink reports basenames, so two
+    # * same-named files of different sizes must not share a scale
+    invariants: dict[tuple[bytes, int], tuple[str, float]] = {}
+
+    def callback(
+        file: bytes,
+        size: int,
+        sent: int,
+        peername: tuple,
+    ):
+        nonlocal last_emit
+
+        now = time.monotonic()
+
+        if sent < size and now < last_emit + interval:
+            return
+
+        last_emit = now
+        entry = invariants.get((file, size))
+
+        if entry is None:
+            prefix = f"{peername[0]}:{peername[1]} | {file.decode('utf-8')}"
+            entry = (prefix, 100.0 / size if size else 100.0)
+            invariants[(file, size)] = entry
+
+        prefix, scale = entry
+        percentage = sent * scale
+
+        if sent < size:
+            sys.stdout.write(f"{prefix} | {percentage:.2f}%\r")
+        else:
+            sys.stdout.write(f"{prefix} | {percentage:.2f}%\n")
+
+    return callback
 
 
 # endregion: Helper methods
@@ -50,6 +169,10 @@ class Connector:
         password: Optional[str] = None,
         ssh_credentials: tuple[Path, Path, Union[str, None]] = tuple(),
         policy=AutoAddPolicy(),
+        use_async: bool = False,
+        keepalive_interval: int = 30,
+        window_size: int = _DEFAULT_WINDOW_SIZE,
+        max_packet_size: int = _DEFAULT_MAX_PACKET_SIZE,
     ):
         """
         Constructor
@@ -61,6 +184,10 @@ class Connector:
            port: Port number of remote host
            ssh_credentials: Path to SSH private key, SSH public key and SSH key passphrase
            policy: Handling policy for unknown server
+           use_async: Transfer files using asyncssh pipelined SFTP when available
+           keepalive_interval: Seconds between SSH keepalive packets, 0 to disable
+           window_size: Flow control window size for new channels in bytes
+           max_packet_size: Maximum packet size for new channels in bytes
         """
         self.username = username
         self.password = password
@@ -71,6 +198,10 @@ class Connector:
         self.ssh_public_key_file = None
         self.ssh_key_passphrase = None
         self.policy = policy
+        self.use_async = use_async
+        self.keepalive_interval = keepalive_interval
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
 
         if ssh_credentials:
             credentials = [
@@ -89,28 +220,80 @@ class Connector:
             else:
                 raise FileExistsError(f"Invalid SSH Private/Public Key File")
 
-        def __repr__(self):
-            return f"<Connector: {self.host}>"
-
         self._retrieve_ssh_key()
         self.ssh_client = self._create_ssh_client()
-        self.scp_client = self._create_scp_client()
-        self.sftp_client = self._create_sftp_client()
+
+        # * Lambdas defer attribute access so lazy clients are only
+        # * materialized when their enum is actually requested
+        self._client_map = {
+            Client.SSHClient: lambda: self.ssh_client,
+            Client.SCPClient: lambda: self.scp_client,
+            Client.SFTPClient: lambda: self.sftp_client,
+        }
+
+    def __repr__(self):
+        return f"<Connector: {self.host}>"
 
     def disconnect(
         self,
     ):
         """
         Disconnect all clients from remote host
+
+        Remarks:
+            Safe to call more than once; the SSH client is released to
+            the pool exactly once and the lazy clients are dropped so
+            a stale channel is never reused.
         """
         if self.ssh_client:
-            self.ssh_client.close()
+            pool.release(self._pool_key(), self.ssh_client)
+            self.ssh_client = None
 
-        if hasattr(self, "scp_client") and self.scp_client:
-            self.scp_client.close()
+        # * Pop from __dict__ to avoid materializing lazy clients
+        # * just to close them
+        scp_client = self.__dict__.pop("scp_client", None)
+        sftp_client = self.__dict__.pop("sftp_client", None)
 
-        if hasattr(self, "sftp_client") and self.sftp_client:
-            self.sftp_client.close()
+        if scp_client:
+            scp_client.close()
+
+        if sftp_client:
+            sftp_client.close()
+
+    def _pool_key(
+        self,
+    ) -> tuple:
+        """
+        Compose connection identity used to pool SSH clients
+        """
+        fingerprint = self.ssh_private_key.get_fingerprint() if self.ssh_private_key else None
+
+        return (self.host, self.port, self.username, fingerprint)
+
+    def _configure_transport(
+        self,
+        client: SSHClient,
+    ):
+        """
+        Apply this connector's transport settings to a client
+
+        Args:
+            client: Client whose transport is to be configured
+
+        Remarks:
+            Pooled borrows arrive with the previous owner's settings,
+            so this runs for fresh and borrowed clients alike. The
+            SCP/SFTP channels are opened lazily afterwards and pick up
+            the defaults set here. Keepalives stop idle pooled
+            sessions from being silently dropped by NAT/firewalls,
+            which would degrade the connection pool to a cold cache.
+        """
+        transport = client.get_transport()
+
+        if transport:
+            transport.set_keepalive(self.keepalive_interval)
+            transport.default_window_size = self.window_size
+            transport.default_max_packet_size = self.max_packet_size
 
     def _create_ssh_client(
         self,
@@ -120,6 +303,11 @@ class Connector:
         Create an SSH client
 
         Remarks:
+            An already-authenticated client is borrowed from the
+            connection pool when one is available for the connection
+            identity, skipping the key exchange and authentication
+            cost entirely.
+
             Order of authentication:
             - pkey | self.ssh_key
             - key_filename | self.ssh_private_key_file
@@ -127,10 +315,22 @@ class Connector:
             - look_for_keys | Keys discoverable in ~/.ssh
             - username | self.username
         """
+        client = pool.acquire(self._pool_key())
+
+        if client:
+            self._configure_transport(client)
+            self.ssh_client = client
+
+            return client
+
         try:
             client = SSHClient()
             client.set_missing_host_key_policy(self.policy)
-            client.load_system_host_keys()
+
+            known_hosts = Path.home().joinpath(".ssh", "known_hosts")
+
+            if known_hosts.exists():
+                client._system_host_keys = _load_known_hosts(str(known_hosts), known_hosts.stat().st_mtime_ns)
 
             if self.ssh_private_key:
                 client.connect(
@@ -166,6 +366,7 @@ class Connector:
                     )
                 )
 
+            self._configure_transport(client)
             self.ssh_client = client
 
             return client
@@ -175,9 +376,27 @@ class Connector:
         except AuthenticationException as error:
             raise error
 
+    @cached_property
+    def scp_client(
+        self,
+    ) -> SCPClient:
+        """
+        SCP client, created on first use
+        """
+        return self._create_scp_client()
+
+    @cached_property
+    def sftp_client(
+        self,
+    ) -> SFTPClient:
+        """
+        SFTP client, created on first use
+        """
+        return self._create_sftp_client()
+
     def _create_scp_client(
         self,
-        callback: Callable = _scp_client_progress_text_callback,
+        callback: Optional[Callable] = None,
     ) -> SCPClient:
         """
         Creates an SCP client
@@ -185,12 +404,15 @@ class Connector:
         Args:
             callback: Task progress callback function
         """
+        if callback is None:
+            callback = _make_scp_progress_callback()
+
         transport = self.ssh_client.get_transport()
 
-        if not isinstance(transport, type(None)):
-            self.scp_client = SCPClient(transport, progress4=callback)
+        if isinstance(transport, type(None)):
+            raise Exception(f"SSH transport is not available")
 
-        return self.scp_client
+        return SCPClient(transport, progress4=callback)
 
     def _create_sftp_client(
         self,
@@ -198,9 +420,7 @@ class Connector:
         """
         Creates an SFTP client
         """
-        self.sftp_client = self.ssh_client.open_sftp()
-
-        return self.sftp_client
+        return self.ssh_client.open_sftp()
 
     def _get_client(
         self,
@@ -209,14 +429,7 @@ class Connector:
         """
         Get client type
         """
-        if client == Client.SSHClient:
-            return self.ssh_client
-
-        elif client == Client.SCPClient:
-            return self.scp_client
-
-        else:
-            return self.sftp_client
+        return self._client_map[client]()
 
     def _retrieve_ssh_key(
         self,
@@ -225,9 +438,12 @@ class Connector:
         Retrieve SSH key from localhost
         """
         if self.ssh_private_key_file:
-            self.ssh_private_key = RSAKey.from_private_key_file(
+            stat = os.stat(self.ssh_private_key_file)
+
+            self.ssh_private_key = _load_rsa_key(
                 str(self.ssh_private_key_file),
                 self.ssh_key_passphrase,
+                stat.st_mtime_ns,
             )
 
             return self.ssh_private_key
@@ -237,15 +453,92 @@ class Connector:
     ):
         """
         Upload SSH key to remote server
+
+        Remarks:
+            The key is appended to ~/.ssh/authorized_keys over the
+            already-open SFTP channel, avoiding the second end-to-end
+            SSH handshake and fork/exec that shelling out to
+            ssh-copy-id would cost. Duplicate entries are skipped.
         """
-        command = (
-            f"ssh-copy-id -i {self.ssh_public_key_file} -p {self.port} " f"{self.username}@{self.host}>/dev/null 2>&1"
-        )
+        if not self.ssh_public_key_file:
+            return
+
+        public_key = self.ssh_public_key_file.read_text().strip()
+        path = ".ssh/authorized_keys"
 
         try:
-            system(command)
-        except Exception as error:
-            raise error
+            self.sftp_client.mkdir(".ssh", 0o700)
+        except IOError:
+            pass
+
+        try:
+            with self.sftp_client.open(path, "r") as handle:
+                entries = handle.read().decode("utf-8")
+        except IOError:
+            entries = ""
+
+        if public_key in entries:
+            return
+
+        with self.sftp_client.open(path, "a") as handle:
+            handle.write(f"{public_key}\n")
+
+        self.sftp_client.chmod(path, 0o600)
+
+    def _transfer_file_async(
+        self,
+        action: str,
+        source: str,
+        destination: str,
+    ) -> bool:
+        """
+        Transfer a file using asyncssh pipelined SFTP
+
+        Args:
+            action: Transfer direction, either "get" or "put"
+            source: File to be transferred
+            destination: Path to transfer file to
+
+        Remarks:
+            asyncssh keeps up to 128 read/write requests in flight per
+            transfer on a single channel, which beats paramiko's serial
+            SFTP loop for large files. Returns False when asyncssh is
+            unavailable (install the "async" extra) or the transfer
+            fails at the SFTP/socket level (e.g. servers rejecting
+            large block sizes), so callers can fall back to paramiko.
+            Authentication and host key failures propagate; host keys
+            are verified against ~/.ssh/known_hosts.
+        """
+        if asyncssh is None:
+            return False
+
+        async def _run():
+            client_keys = [str(self.ssh_private_key_file)] if self.ssh_private_key_file else None
+
+            async with asyncssh.connect(
+                self.host,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                client_keys=client_keys,
+                passphrase=self.ssh_key_passphrase,
+            ) as connection:
+                async with connection.start_sftp_client() as sftp:
+                    transfer = sftp.get if action == "get" else sftp.put
+
+                    await transfer(
+                        source,
+                        destination,
+                        block_size=_ASYNC_BLOCK_SIZE,
+                        max_requests=_ASYNC_MAX_REQUESTS,
+                    )
+
+        try:
+            asyncio.run(_run())
+        except (OSError, asyncssh.SFTPError):
+            return False
+
+        return True
 
     def _download_file(
         self,
@@ -264,6 +557,9 @@ class Connector:
             destination: Directory path to download file to
             recursive: Recursively download contents of source directory
         """
+        if self.use_async and not recursive and self._transfer_file_async("get", source, str(destination)):
+            return
+
         _client = self._get_client(client)
 
         # Download using SCP client (Faster option)
@@ -284,6 +580,7 @@ class Connector:
         sources: list[str],
         destination: Union[Path, str] = "",
         recursive: bool = False,
+        **kwargs,
     ):
         """
         Download files from remote host
@@ -293,8 +590,78 @@ class Connector:
             sources: Collection of remote files to be downloaded
             destination: Directory path to download files to
             recursive: Recursively download contents of source directory
+
+        Remarks:
+            SCP downloads are batched so many sources share a single
+            handshake instead of paying one per file.
+        """
+        if not sources:
+            return
+
+        if client == Client.SFTPClient:
+            self._download_files_sftp(sources, destination, **kwargs)
+
+            return
+
+        _client = self._get_client(client)
+
+        if isinstance(_client, SCPClient):
+            for batch in _batch(sources, _SCP_BATCH_SIZE):
+                _client.get(batch, local_path=str(destination), recursive=recursive, **kwargs)
+
+        else:
+            for source in sources:
+                self._download_file(client, source, destination, recursive, **kwargs)
+
+    def _download_files_sftp(
+        self,
+        sources: list[str],
+        destination: Union[Path, str] = "",
+        **kwargs,
+    ):
+        """
+        Download files concurrently from remote host using SFTP
+
+        Args:
+            sources: Collection of remote files to be downloaded
+            destination: Directory path to download files to
+
+        Remarks:
+            Transfers are submitted to a thread pool so the server
+            pipelines reads across files instead of awaiting each
+            transfer in turn. SFTPClient is not safe for concurrent
+            transfers, so each worker opens its own session over the
+            shared transport.
         """
-        [self._download_file(client, source, destination, recursive) for source in sources]
+        _destination = Path(destination)
+        local = threading.local()
+        sessions: list[SFTPClient] = []
+
+        def _download(source: str):
+            session = getattr(local, "sftp_client", None)
+
+            if session is None:
+                session = local.sftp_client = self.ssh_client.open_sftp()
+                sessions.append(session)
+
+            session.get(source, str(_destination.joinpath(posixpath.basename(source))), **kwargs)
+
+        # * One session channel per worker; stay below the server's
+        # * MaxSessions ceiling with headroom for an already-open
+        # * SCP/SFTP channel
+        workers = min(_MAX_CONCURRENT_CHANNELS - 1, len(sources))
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_download, source) for source in sources]
+
+                concurrent.futures.wait(futures)
+
+                for future in futures:
+                    future.result()
+        finally:
+            for session in sessions:
+                session.close()
 
     def _upload_file(
         self,
@@ -311,6 +678,9 @@ class Connector:
             source: Local file to be uploaded
             destination: Directory path to be uploaded to
         """
+        if self.use_async and self._transfer_file_async("put", str(source), destination):
+            return
+
         _client = self._get_client(client)
 
         # Upload using SCP client (Faster option)
@@ -340,14 +710,31 @@ class Connector:
             sources: Collection of local files to be uploaded
             destination: Directory path to be uploaded to
             recursive: Recursively upload contents of source directory
+
+        Remarks:
+            SCP uploads are batched so many sources share a single
+            handshake instead of paying one per file. Directory trees
+            are flattened up front with rglob rather than re-entering
+            this method per entry.
         """
+        paths: list[Path] = []
+
         for source in sources:
             if source.is_file():
-                self._upload_file(client, source, destination, **kwargs)
+                paths.append(source)
+
+            elif source.is_dir() and recursive:
+                paths.extend(path for path in source.rglob("*") if path.is_file())
+
+        _client = self._get_client(client)
+
+        if isinstance(_client, SCPClient):
+            for batch in _batch(paths, _SCP_BATCH_SIZE):
+                _client.put([str(path) for path in batch], remote_path=destination)
 
-            if source.is_dir() and recursive:
-                for item in source.iterdir():
-                    self._upload_files(client, [item], destination, **kwargs)
+        else:
+            for path in paths:
+                self._upload_file(client, path, destination, **kwargs)
 
     def _execute_commands(
         self,
@@ -358,14 +745,63 @@ class Connector:
 
         Args:
             commands: Collection of commands to be executed
+
+        Remarks:
+            Commands are concatenated into a single shell invocation so
+            N commands cost one channel round trip instead of N.
+        """
+        if not commands:
+            return
+
+        command = " && ".join(commands)
+
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+
+        # * Iterate stdout directly to stream lines as they arrive
+        # * rather than buffering everything until EOF
+        for line in stdout:
+            print(f"Input: {command} \n" f"Result: {line}")
+
+        stdout.channel.recv_exit_status()
+
+    def _execute_commands_parallel(
+        self,
+        commands: list[str],
+    ):
+        """
+        Execute independent BASH commands concurrently on host
+
+        Args:
+            commands: Collection of commands to be executed
+
+        Remarks:
+            Unlike _execute_commands, each command runs on its own
+            channel so stdout is captured per command. All channels in
+            a batch are opened before any exit status is awaited,
+            turning N serial round trips into one per batch; batch
+            size stays below the common server MaxSessions ceiling.
         """
-        for command in commands:
-            stdin, stdout, stderr = self.ssh_client.exec_command(command)
-            stdout.channel.recv_exit_status()
-            response = stdout.readlines()
+        transport = self.ssh_client.get_transport()
+
+        if isinstance(transport, type(None)):
+            raise Exception(f"SSH transport is not available")
+
+        for batch in _batch(commands, _MAX_CONCURRENT_CHANNELS):
+            channels = []
 
-            for line in response:
-                print(f"Input: {command} \n" f"Result: {line}")
+            for command in batch:
+                channel = transport.open_session()
+                channel.exec_command(command)
+                channels.append(channel)
+
+            for channel, command in zip(channels, batch):
+                stdout = channel.makefile("r")
+
+                for line in stdout:
+                    print(f"Input: {command} \n" f"Result: {line}")
+
+                channel.recv_exit_status()
+                channel.close()
 
     # region: SFTP only commands
 
@@ -426,8 +862,13 @@ class Connector:
 
         Args:
             paths: Collection of directories to be removed
+
+        Remarks:
+            Directories are removed in the order supplied, so nested
+            paths must be listed children first.
         """
-        [self._remove_directory(path) for path in paths]
+        for path in paths:
+            self._remove_directory(path)
 
     def _remove_file(
         self,
@@ -451,7 +892,8 @@ class Connector:
         Args:
             paths: Collection of files to be removed
         """
-        [self._remove_file(path) for path in paths]
+        for path in paths:
+            self._remove_file(path)
 
     # endregion: SFTP only commands
 
@@ -481,9 +923,13 @@ class Connector:
             client: Transport client to facilitate upload task
             sources: Collection of media directories to be backed up
             destination: Directory path to download file to
+
+        Remarks:
+            All directories are handed to a single batched transfer,
+            so the encryption setup is paid once rather than per
+            directory.
         """
-        for source in sources:
-            self._download_file(client, source, destination, recursive=True, **kwargs)
+        self._download_files(client, sources, destination, recursive=True, **kwargs)
 
     def backup_android_document_directories(
         self,
@@ -500,9 +946,13 @@ class Connector:
             client: Transport client to facilitate upload task
             sources: Collection of document directories to be backed up
             destination: Directory path to download file to
+
+        Remarks:
+            All directories are handed to a single batched transfer,
+            so the encryption setup is paid once rather than per
+            directory.
         """
-        for source in sources:
-            self._download_file(client, source, destination, recursive=True, **kwargs)
+        self._download_files(client, sources, destination, recursive=True, **kwargs)
 
     def create_android_directories(
         self,
@@ -514,8 +964,10 @@ class Connector:
         Args:
             path: Collection of directory paths to create
         """
-        commands = [f"mkdir -p {i}" for i in paths]
+        # * mkdir -p accepts multiple arguments, so all directories
+        # * are created with a single command
+        command = " ".join(["mkdir", "-p", *paths])
 
-        self._execute_commands(commands)
+        self._execute_commands([command])
 
     # endregion: Helper methods for Android hosts
@@ -0,0 +1,123 @@
+import threading
+import weakref
+from collections import deque
+
+from paramiko import SSHClient
+
+# * Connection identity: (host, port, username, key_fingerprint)
+PoolKey = tuple
+
+
+class ConnectionPool:
+    """
+    Process wide pool of authenticated SSH clients
+
+    Remarks:
+        Clients are keyed by their connection identity so that repeated
+        short-lived connectors to the same host skip the TCP, key
+        exchange and authentication cost of establishing a fresh
+        connection.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 8,
+    ):
+        """
+        Constructor
+
+        Args:
+            maxsize: Maximum number of idle clients retained per key
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, deque[SSHClient]] = {}
+        self._finalized: weakref.WeakSet = weakref.WeakSet()
+
+    def acquire(
+        self,
+        key: PoolKey,
+    ):
+        """
+        Borrow an idle authenticated client for the given key
+
+        Args:
+            key: Connection identity of the requested client
+
+        Remarks:
+            Stale clients found on borrow are closed and discarded.
+            Returns None when no live client is pooled for the key.
+        """
+        with self._lock:
+            clients = self._idle.get(key)
+
+            while clients:
+                client = clients.pop()
+
+                if self._is_alive(client):
+                    return client
+
+                client.close()
+
+        return None
+
+    def release(
+        self,
+        key: PoolKey,
+        client: SSHClient,
+    ):
+        """
+        Return a client to the pool for later reuse
+
+        Args:
+            key: Connection identity of the client
+            client: Authenticated client to be pooled
+
+        Remarks:
+            Dead clients and clients beyond the per key capacity are
+            closed instead of pooled. Pooled sockets are closed when
+            the client object is garbage collected.
+        """
+        with self._lock:
+            clients = self._idle.setdefault(key, deque())
+
+            if len(clients) >= self.maxsize or not self._is_alive(client):
+                client.close()
+
+                return
+
+            transport = client.get_transport()
+
+            # * Register the closing finalizer once per client, not
+            # * once per release, so acquire/release cycles do not
+            # * accumulate finalizers
+            if transport and client not in self._finalized:
+                weakref.finalize(client, transport.close)
+                self._finalized.add(client)
+
+            clients.append(client)
+
+    @staticmethod
+    def _is_alive(
+        client: SSHClient,
+    ) -> bool:
+        """
+        Validate liveness of a client
+
+        Args:
+            client: Client to be validated
+        """
+        transport = client.get_transport()
+
+        if transport is None or not transport.is_active():
+            return False
+
+        try:
+            transport.send_ignore()
+        except EOFError:
+            return False
+
+        return True
+
+
+pool = ConnectionPool()
@@ -42,15 +42,7 @@ def main(
 
     _version = VersionInfo.parse(text)
 
-    conditions = [
-        major == False,
-        minor == False,
-        patch == False,
-        prerelease == False,
-        build == False,
-    ]
-
-    if all(conditions):
+    if not any((major, minor, patch, prerelease, build)):
         print(f"Current version: {_version}")
         exit()
 
@@ -69,25 +61,19 @@ def main(
     if build:
         _version = _version.bump_build()
 
-    confirmed = False
+    while True:
+        response = input(f"Upgrade current version: v{text} to v{_version} - Confirm (Y/N): ").strip().upper()
 
-    while not confirmed:
-        response = input(f"Upgrade current version: v{text} to v{_version} - Confirm (Y/N): ")
-
-        if not response.upper() in ["Y", "N"]:
+        if response not in {"Y", "N"}:
             print(f"Invalid response, try again.\n")
 
             continue
-        else:
-            if response.upper() == "Y":
-                confirmed = True
 
-                REFERENCE_FILE.write_text(str(_version))
-                MODULE_FILE.write_text(f'VERSION="{str(_version)}"')
+        if response == "Y":
+            REFERENCE_FILE.write_text(str(_version))
+            MODULE_FILE.write_text(f'VERSION="{str(_version)}"')
 
-                break
-            else:
-                break
+        break
 
 
 if __name__ == "__main__":
@@ -127,10 +113,4 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    main(
-        major=args.major,
-        minor=args.minor,
-        patch=args.patch,
-        prerelease=args.prerelease,
-        build=args.build,
-    )
+    main(**vars(args))